@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from os import linesep
-from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, NoReturn, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, DefaultDict, Dict, FrozenSet, Iterable, List, NoReturn, Optional, Set, Tuple
 
 from cognite.client import CogniteClient
-from cognite.client.data_classes.iam import TokenInspection
 from cognite.client.exceptions import CogniteAPIError
 
 from exceptions import MissingAclError
@@ -15,16 +15,29 @@ from utils import inspect_token, retrieve_dataset, retrieve_groups_in_user_scope
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Capability:
     acl: str
     actions: List[str]
     scope: Dict[str, Any]
+    _dataset_ids: FrozenSet[int] = field(init=False, repr=False, compare=False)
+    _id_scope_ids: FrozenSet[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Scoped IDs may come as strings; parse once instead of on every scope check:
+        object.__setattr__(self, "_dataset_ids", self._parse_scoped_ids("datasetScope"))
+        object.__setattr__(self, "_id_scope_ids", self._parse_scoped_ids("idScope"))
+
+    def _parse_scoped_ids(self, scope_name: str) -> FrozenSet[int]:
+        if scope := self.scope.get(scope_name):
+            return frozenset(map(int, scope.get("ids", ())))
+        return frozenset()
 
     @classmethod
     def from_dct(cls, dct: Dict[str, Any]) -> Capability:
-        acl, *unexpected = dct
-        if unexpected:
+        if len(dct) == 1:
+            acl = next(iter(dct))
+        else:
             acls = [k for k in dct if k.endswith("Acl")]
             if len(acls) != 1:
                 raise MissingAclError(f"Unable to parse Acl for {dct}")
@@ -35,14 +48,43 @@ class Capability:
         return "all" in self.scope
 
     def is_dataset_scope(self, id: int) -> bool:
-        return id in map(int, self.scope.get("datasetScope", {}).get("ids", []))
+        return id in self._dataset_ids
 
     def is_ids_scope(self, id: int) -> bool:
-        return id in map(int, self.scope.get("idScope", {}).get("ids", []))
+        return id in self._id_scope_ids
+
+
+class CapabilityIndex:
+    """Capabilities grouped by their ACL name (e.g. "functionsAcl"), with actions aggregated once at parse time."""
+
+    def __init__(self, capabs: Iterable[Capability]):
+        by_acl: DefaultDict[str, List[Capability]] = defaultdict(list)
+        actions: DefaultDict[str, Set[str]] = defaultdict(set)
+        all_scope_actions: DefaultDict[str, Set[str]] = defaultdict(set)
+        for c in capabs:
+            by_acl[c.acl].append(c)
+            actions[c.acl].update(c.actions)
+            if c.is_all_scope():
+                all_scope_actions[c.acl].update(c.actions)
+
+        self.by_acl: Dict[str, Tuple[Capability, ...]] = {acl: tuple(c) for acl, c in by_acl.items()}
+        self.actions_by_acl: Dict[str, FrozenSet[str]] = {acl: frozenset(a) for acl, a in actions.items()}
+        self.all_scope_actions_by_acl: Dict[str, FrozenSet[str]] = {
+            acl: frozenset(a) for acl, a in all_scope_actions.items()
+        }
+
+    def get(self, acl: str) -> Tuple[Capability, ...]:
+        return self.by_acl.get(acl, ())
+
+    def actions(self, acl: str) -> FrozenSet[str]:
+        return self.actions_by_acl.get(acl, frozenset())
 
+    def all_scope_actions(self, acl: str) -> FrozenSet[str]:
+        return self.all_scope_actions_by_acl.get(acl, frozenset())
 
-def retrieve_and_parse_capabilities(client: CogniteClient, project: str) -> List[Capability]:
-    return list(
+
+def retrieve_and_parse_capabilities(client: CogniteClient, project: str) -> CapabilityIndex:
+    return CapabilityIndex(
         map(
             Capability.from_dct,
             (c for group in retrieve_groups_in_user_scope(client) for c in group.capabilities),
@@ -50,14 +92,13 @@ def retrieve_and_parse_capabilities(client: CogniteClient, project: str) -> List
     )
 
 
-def filter_capabilities(capabs: Iterable[Capability], acl: str) -> Iterator[Capability]:
-    return filter(lambda c: c.acl == acl, capabs)
-
-
 ACL_PROJECT_LIST = "projects:LIST (scope: 'all')"
 ACL_GROUPS_LIST = "groups:LIST (scope: 'all' OR 'currentuserscope')"
 MISSING_ACLS_WARNING = "(There might be more missing, but need the above-mentioned first to check!)"
 
+_READ_WRITE = frozenset(("READ", "WRITE"))
+_WRITE = frozenset(("WRITE",))
+
 
 def missing_basic_capabilities(client: CogniteClient, project: str, cred_name: str) -> List[str]:
     missing = []
@@ -89,28 +130,22 @@ def missing_basic_capabilities(client: CogniteClient, project: str, cred_name: s
     return missing
 
 
-def missing_function_capabilities(
-    capabs: Iterable[Capability], required_actions: AbstractSet = frozenset(("READ", "WRITE"))
-) -> List[str]:
-    actions = set(a for c in filter_capabilities(capabs, acl="functionsAcl") for a in c.actions)
-    if missing := required_actions - actions:
+def missing_function_capabilities(capabs: CapabilityIndex, required_actions: AbstractSet = _READ_WRITE) -> List[str]:
+    if missing := required_actions - capabs.actions("functionsAcl"):
         return [f"FunctionsAcl:{m} (scope: 'all')" for m in missing]
     return []
 
 
-def missing_session_capabilities(capabs: Iterable[Capability]) -> List[str]:
-    actions = set(a for c in filter_capabilities(capabs, acl="sessionsAcl") for a in c.actions)
-    if "CREATE" not in actions:
+def missing_session_capabilities(capabs: CapabilityIndex) -> List[str]:
+    if "CREATE" not in capabs.actions("sessionsAcl"):
         return ["SessionsAcl:CREATE (scope: 'all')"]
     return []
 
 
 def missing_files_capabilities(
-    capabs: Iterable[Capability], client: CogniteClient, ds_id: Optional[int] = None
+    capabs: CapabilityIndex, client: CogniteClient, ds_id: Optional[int] = None
 ) -> List[str]:
-    files_capes = list(filter_capabilities(capabs, acl="filesAcl"))
-    files_actions_all_scope = set(a for c in files_capes for a in c.actions if c.is_all_scope())
-    missing_files_acl = set(["READ", "WRITE"]) - files_actions_all_scope
+    missing_files_acl = _READ_WRITE - capabs.all_scope_actions("filesAcl")
 
     if ds_id is None:
         # Not using a data set, so we require Files:READ/WRITE in scope=ALL:
@@ -120,12 +155,14 @@ def missing_files_capabilities(
 
     # If using a data set, we also accept *it* as scope for files:
     missing_acls = []
-    files_actions_dsid_scope = set(a for c in files_capes for a in c.actions if c.is_dataset_scope(ds_id))
-    if missing_files_acl := missing_files_acl - files_actions_dsid_scope:
-        missing_acls += [f"FilesAcl:{m} (scope: 'all' OR 'dataset: {ds_id}')" for m in missing_files_acl]
-
-    data_set_capes = filter_capabilities(capabs, acl="datasetsAcl")
-    data_set_actions = set(a for c in data_set_capes for a in c.actions if c.is_all_scope() or c.is_ids_scope(ds_id))
+    if missing_files_acl:
+        files_capes = capabs.get("filesAcl")
+        files_actions_dsid_scope = set().union(*(c.actions for c in files_capes if c.is_dataset_scope(ds_id)))
+        if missing_files_acl := missing_files_acl - files_actions_dsid_scope:
+            missing_acls += [f"FilesAcl:{m} (scope: 'all' OR 'dataset: {ds_id}')" for m in missing_files_acl]
+
+    data_set_capes = capabs.get("datasetsAcl")
+    data_set_actions = set().union(*(c.actions for c in data_set_capes if c.is_all_scope() or c.is_ids_scope(ds_id)))
     if "READ" not in data_set_actions:
         # No read access to the given data set, so we can't check if it is write protected:
         missing_acls.append(f"DatasetsAcl:READ (scope: 'all' OR 'id: {ds_id}')")
@@ -133,24 +170,22 @@ def missing_files_capabilities(
             missing_acls.append("(If dataset is write protected, you'll also need OWNER)")
         return missing_acls
 
-    if retrieve_dataset(client, ds_id).write_protected:
-        if "OWNER" not in data_set_actions:
-            missing_acls.append(f"DatasetsAcl:OWNER (scope: 'all' OR 'id: {ds_id}'). NB: 'all scope' not recommended!")
+    # Always look up the data set (also verifies that it exists), but with OWNER write protection does not matter:
+    if retrieve_dataset(client, ds_id).write_protected and "OWNER" not in data_set_actions:
+        missing_acls.append(f"DatasetsAcl:OWNER (scope: 'all' OR 'id: {ds_id}'). NB: 'all scope' not recommended!")
     return missing_acls
 
 
-def check_basics_and_retrieve_capabilities(client: CogniteClient, project: str, cred_name: str) -> List[Capability]:
+def check_basics_and_retrieve_capabilities(client: CogniteClient, project: str, cred_name: str) -> CapabilityIndex:
     if missing_basic := missing_basic_capabilities(client, project, cred_name):
         raise_on_missing(missing_basic, cred_name)
 
     return retrieve_and_parse_capabilities(client, project)
 
 
-def verify_schedule_creds_capabilities(
-    client: CogniteClient, project: str, cred_name: str = "schedule"
-) -> TokenInspection:
+def verify_schedule_creds_capabilities(client: CogniteClient, project: str, cred_name: str = "schedule") -> None:
     capabs = check_basics_and_retrieve_capabilities(client, project, cred_name)
-    missing = missing_function_capabilities(capabs, required_actions={"WRITE"}) + missing_session_capabilities(capabs)
+    missing = missing_function_capabilities(capabs, required_actions=_WRITE) + missing_session_capabilities(capabs)
     if missing:
         raise_on_missing(missing, cred_name)
     logger.info("Schedule credentials capabilities verified!")
@@ -161,8 +196,13 @@ def verify_deploy_capabilites(
     project: str,
     ds_id: Optional[int] = None,
     cred_name: str = "deploy",
-):
-    capabs = check_basics_and_retrieve_capabilities(client, project, cred_name)
+) -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if ds_id is not None:
+            # Warm the (cached) data set lookup while checking the basics. Errors are ignored here, as they are
+            # not cached, the lookup in 'missing_files_capabilities' below raises them again (before any deploy):
+            executor.submit(retrieve_dataset, client, ds_id)
+        capabs = check_basics_and_retrieve_capabilities(client, project, cred_name)
     missing = missing_function_capabilities(capabs) + missing_files_capabilities(capabs, client, ds_id)
     if missing:
         raise_on_missing(missing, cred_name)
@@ -170,7 +210,7 @@ def verify_deploy_capabilites(
 
 
 def raise_on_missing(missing: List[str], cred_type: str) -> NoReturn:
-    missing_info = linesep.join(f"- {i}: {s}" for i, s in enumerate(missing, 1))
+    missing_info = "\n".join(f"- {i}: {s}" for i, s in enumerate(missing, 1))
     raise MissingAclError(
         f"{cred_type.upper()} credentials missing one (or more) required capabilities:\n{missing_info}"
     )
@@ -1,17 +1,18 @@
 import ast
 import logging
 from pathlib import Path
-from typing import List
 
 from cognite.client import CogniteClient
 
 from configs import FunctionConfig
 from exceptions import FunctionValidationError
+from utils import retrieve_function_limits
 
 logger = logging.getLogger(__name__)
 
 
 HANDLE_ARGS = ("data", "client", "secrets", "function_call_info")
+HANDLE_ARGS_SET = frozenset(HANDLE_ARGS)
 
 
 def run_checks(config: FunctionConfig, client: CogniteClient) -> None:
@@ -22,7 +23,7 @@ def run_checks(config: FunctionConfig, client: CogniteClient) -> None:
 
 
 def _check_params_against_backend_limits(config: FunctionConfig, client: CogniteClient) -> None:
-    lims = client.functions.limits()
+    lims = retrieve_function_limits(client)
     if (cpu := config.cpu) is not None:
         if not lims.cpu_cores["min"] <= cpu <= lims.cpu_cores["max"]:
             logger.warning(
@@ -40,52 +41,42 @@ def _check_params_against_backend_limits(config: FunctionConfig, client: Cognite
         )
 
 
-class HandleVisitor(ast.NodeVisitor):
-    def __init__(self, file_path: Path):
-        self.file_path = file_path
-        self.handle_found = False
-        self.fn_names: List[str] = []
+def _check_handle_args(file_path: Path, fn_name: str = "handle") -> None:
+    # If missing raises FileNotFoundError, which is a perfectly fine error message
+    try:
+        tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
+    except SyntaxError:
+        logger.error(
+            f"Unable to parse file '{file_path}' and check for valid handle args! Please open an issue "
+            "on github.com/cognitedata/function-action-oidc"
+        )
+        return
 
-    def visit_FunctionDef(self, fn_def):
-        """Overridden to get root function definitions only."""
-        self.fn_names.append(name := fn_def.name)  # The things we do for nice error messages
+    handle_found, fn_names = False, []
+    for fn_def in tree.body:  # Root function definitions only
+        if not isinstance(fn_def, ast.FunctionDef):
+            continue
+        fn_names.append(name := fn_def.name)  # The things we do for nice error messages
         if name != "handle":
-            return
-        if self.handle_found:
+            continue
+        if handle_found:
             logger.error(err_msg := "Multiple function definitions found!")
             raise FunctionValidationError(err_msg)
 
-        bad_args = set(param.arg for param in fn_def.args.args).difference(HANDLE_ARGS)
-        if not bad_args:
-            logger.info(f"Signature of function entrypoint, 'handle', in file '{self.file_path}' validated!")
-            self.handle_found = True
-        else:
+        if bad_args := {param.arg for param in fn_def.args.args} - HANDLE_ARGS_SET:
             err_msg = (
-                f"In file '{self.file_path}', function 'handle' contained illegal args: {list(bad_args)}. "
+                f"In file '{file_path}', function 'handle' contained illegal args: {list(bad_args)}. "
                 f"The function args must be a subset of: {list(HANDLE_ARGS)} (ordering does NOT matter!)"
             )
             logger.error(err_msg)
             raise FunctionValidationError(err_msg)
+        logger.info(f"Signature of function entrypoint, 'handle', in file '{file_path}' validated!")
+        handle_found = True
 
-
-def _check_handle_args(file_path: Path, fn_name: str = "handle") -> None:
-    # If missing raises FileNotFoundError, which is a perfectly fine error message
-    with file_path.open() as f:
-        file = f.read()
-
-    try:
-        (node_visitor := HandleVisitor(file_path)).visit(ast.parse(file))
-    except SyntaxError:
-        logger.error(
-            f"Unable to parse file '{file_path}' and check for valid handle args! Please open an issue "
-            "on github.com/cognitedata/function-action-oidc"
-        )
-        return
-
-    if not node_visitor.handle_found:
+    if not handle_found:
         err_msg = (
             f"Required function named '{fn_name}' was not found in file '{file_path}' "
-            f"(functions found: {node_visitor.fn_names})."
+            f"(functions found: {fn_names})."
         )
         logger.error(err_msg)
         raise FunctionValidationError(err_msg)
@@ -1,7 +1,7 @@
 import logging
 
 from cognite.client.data_classes import Function
-from cognite.client.exceptions import CogniteAPIError
+from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
 
 from configs import FunctionConfig
 from utils import create_zipfile_name
@@ -20,8 +20,10 @@ def run_cleanup(fn: Function, fn_config: FunctionConfig) -> None:
 
 def _delete_code_file(fn: Function) -> None:
     file_xid = create_zipfile_name(fn.external_id)
+    # A single request; a pre-check for existence would cost an extra round-trip in the common case
+    # (the file was just uploaded). Note: 'not found' is not a subclass of CogniteAPIError:
     try:
         fn._cognite_client.files.delete(external_id=file_xid)
         logger.info(f"- Code file object deleted! (XID: {file_xid})")
-    except CogniteAPIError:
-        logger.info(f"- Unable to delete file object with external ID: {file_xid})")
+    except (CogniteAPIError, CogniteNotFoundError):
+        logger.info(f"- Unable to delete file object with external ID: {file_xid}")
@@ -1,11 +1,10 @@
 import logging
+from functools import lru_cache
 from os import getenv
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from crontab import CronSlices
 from pydantic import BaseModel, Field, HttpUrl, Json, NonNegativeFloat, NonNegativeInt, root_validator, validator
-from yaml import safe_load  # type: ignore
 
 from access import verify_deploy_capabilites, verify_schedule_creds_capabilities
 from defaults import (
@@ -23,6 +22,7 @@ from utils import (
     NonEmptyStringMax500,
     ToLowerStr,
     YamlFileString,
+    create_oidc_client,
     create_oidc_client_from_dct,
     decode_and_parse,
     verify_path_is_directory,
@@ -41,6 +41,28 @@ if RUNNING_IN_GITHUB_ACTION is RUNNING_IN_AZURE_PIPE:  # Hacky XOR
         "issue on Github: https://github.com/cognitedata/function-action-oidc/"
     )
 
+ENV_VAR_PREFIX = "INPUT_" if RUNNING_IN_GITHUB_ACTION else ""  # Note: No prefix in Azure (is protected)
+
+
+def load_yaml_file(path: Path):
+    # Imported lazily, only needed when a schedule file is given:
+    from yaml import load  # type: ignore
+
+    try:  # Use the (much faster) libyaml-based loader when PyYAML is built with it:
+        from yaml import CSafeLoader as SafeLoader  # type: ignore
+    except ImportError:
+        from yaml import SafeLoader  # type: ignore
+
+    return load(path.read_bytes(), Loader=SafeLoader)  # Let the loader decode, no intermediate str
+
+
+@lru_cache(None)
+def is_valid_cron(cron: str) -> bool:
+    # Schedules often share the same cron expression, only parse each unique one once:
+    from crontab import CronSlices  # Imported lazily, only needed when schedules are given
+
+    return CronSlices.is_valid(cron)
+
 
 class FunctionSchedule(BaseModel):
     class Config:
@@ -53,7 +75,7 @@ class FunctionSchedule(BaseModel):
 
     @validator("cron_expression")
     def validate_cron(cls, cron):
-        if not CronSlices.is_valid(cron):
+        if not is_valid_cron(cron):
             raise ValueError(f"Invalid cron expression: '{cron}'")
         return cron
 
@@ -61,21 +83,21 @@ class FunctionSchedule(BaseModel):
 class GithubActionModel(BaseModel):
     class Config:
         allow_population_by_field_name = True
+        copy_on_model_validation = "none"  # Reuse the (already validated) instance when nested, e.g. in RunConfig
 
     @classmethod
     def from_envvars(cls):
         """Magic parameter-load from env.vars. (Github Action Syntax)"""
+        # Missing args are passed as empty strings, leave them out (load as `None`) instead:
+        return cls.parse_obj(
+            {k: v for k in cls.expected_params() if (v := getenv(f"{ENV_VAR_PREFIX}{k.upper()}", "").strip())}
+        )
 
-        def get_parameter(key, prefix=""):
-            if RUNNING_IN_AZURE_PIPE:
-                prefix = ""  # Just to point out no prefix in Azure (is protected)
-            elif RUNNING_IN_GITHUB_ACTION:
-                prefix = "INPUT_"
-            # Missing args passed as empty strings, load as `None` instead:
-            return getenv(f"{prefix}{key.upper()}", "").strip() or None
-
-        expected_params = cls.schema()["properties"]
-        return cls.parse_obj({k: v for k, v in zip(expected_params, map(get_parameter, expected_params)) if v})
+    @classmethod
+    @lru_cache(None)
+    def expected_params(cls) -> Tuple[str, ...]:
+        # Same as 'cls.schema()["properties"]', but without building the entire JSON schema:
+        return tuple(field.alias for field in cls.__fields__.values())
 
 
 class DeleteFunctionConfig(GithubActionModel):
@@ -87,13 +109,27 @@ class DeleteFunctionConfig(GithubActionModel):
 
 
 class CredentialsModel(BaseModel):
+    # Note: Direct attribute access, pydantic's '.dict()' exports (and copies) the whole model first
+    if TYPE_CHECKING:  # Fields are declared by the subclasses, only let the type checker know:
+        cdf_project: str
+        cdf_cluster: str
+        client_id: Any  # Optional for schedules
+        tenant_id: Any
+        client_secret: Any
+
     @property
     def credentials(self) -> Dict[str, str]:
-        return self.dict(include={"client_id", "client_secret"})
+        return {"client_id": self.client_id, "client_secret": self.client_secret}
 
     @property
     def client(self):
-        return create_oidc_client_from_dct(self.dict(by_alias=False))
+        return create_oidc_client(
+            tenant_id=self.tenant_id,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            cdf_cluster=self.cdf_cluster,
+            cdf_project=self.cdf_project,
+        )
 
 
 class DeployCredentials(GithubActionModel, CredentialsModel):
@@ -124,29 +160,26 @@ class SchedulesConfig(GithubActionModel, CredentialsModel):
     schedules: Optional[List[FunctionSchedule]]
 
     @root_validator(skip_on_failure=True)
-    def verify_schedule_file_and_parse(cls, values):
+    def verify_schedule_file_and_credentials(cls, values):
         if (schedule_file := values["schedule_file"]) is None:
             values["schedules"] = []
             return values
 
-        if (path := values["function_folder"] / schedule_file).is_file():
-            with path.open() as f:
-                if schedules := safe_load(f):
-                    values["schedules"] = list(map(FunctionSchedule.parse_obj, schedules))
-                    return values
-                logger.warning(f"Given schedule file '{schedule_file}' appears empty and was ignored")
-        else:
+        if not (path := values["function_folder"] / schedule_file).is_file():
             logger.warning(f"Ignoring given schedule file '{schedule_file}', path does not exist: {path.absolute()}")
-        values.update({"schedule_file": None, "schedules": []})
-        return values
+            values.update({"schedule_file": None, "schedules": []})
+            return values
 
-    @root_validator(skip_on_failure=True)
-    def verify_schedule_credentials(cls, values):
-        if values["schedule_file"] is None:
+        if not (schedules := load_yaml_file(path)):
+            logger.warning(f"Given schedule file '{schedule_file}' appears empty and was ignored")
+            values.update({"schedule_file": None, "schedules": []})
             return values
+
+        values["schedules"] = list(map(FunctionSchedule.parse_obj, schedules))
+
         # A valid schedule file is given; schedule-credentials are thus required:
         c_secret, c_id, t_id = values["client_secret"], values["client_id"], values["tenant_id"]
-        if None in [c_secret, c_id, t_id]:
+        if not (c_secret and c_id and t_id):
             raise ValueError(
                 "Schedules created for OIDC functions require additional client credentials (to be used at runtime). "
                 "Missing one or more of ['schedules_client_secret', 'schedules_client_id', 'schedules_tenant_id']"
@@ -218,7 +251,7 @@ class FunctionConfig(GithubActionModel):
             logger.info("No 'common code' directory added to the function!")
         else:
             verify_path_is_directory(common_folder, "common_folder")
-            if len(Path(common_folder).parts) > 1:
+            if len(common_folder.parts) > 1:
                 raise ValueError(f"Common folder: '{common_folder}' cannot be a nested folder")
         return values
 
@@ -21,23 +21,29 @@ class FunctionStatus:
 
 def await_function_deployment(fn: Function, function_deploy_timeout: int) -> Function:
     deploy_time = time.time()
+    deadline = deploy_time + function_deploy_timeout
     next_info_log = deploy_time + 90  # Log progress every 90 sec
-    while (now := time.time()) <= deploy_time + function_deploy_timeout:
-        elapsed_time = precisedelta(now - deploy_time)
+    poll_delay = 2.0  # Poll often at first, then back off (up to 10 sec)
+    while (now := time.time()) <= deadline:
+        # Note: 'precisedelta' is only called when we actually log:
         if fn.status == FunctionStatus.READY:
-            logger.info(f"Function deployment successful! Deployment took {elapsed_time}")
+            logger.info(f"Function deployment successful! Deployment took {precisedelta(now - deploy_time)}")
             return fn
 
         elif fn.status == FunctionStatus.FAILED:
             err_msg = f"{fn.error['message']}. Trace:\n{fn.error['trace']}"
-            logger.error(f"Deployment failed after {elapsed_time}! API returned error: {err_msg}")
+            logger.error(f"Deployment failed after {precisedelta(now - deploy_time)}! API returned error: {err_msg}")
             raise FunctionDeployError(err_msg)
 
         elif now > next_info_log:
             next_info_log += 90
-            logger.info(f"- Deployment in progress, current status: '{fn.status}', time elapsed: {elapsed_time}")
+            logger.info(
+                f"- Deployment in progress, current status: '{fn.status}', "
+                f"time elapsed: {precisedelta(now - deploy_time)}"
+            )
 
-        time.sleep(5)
+        time.sleep(min(poll_delay, max(deadline - now, 1)))  # Don't overshoot the timeout (by much)
+        poll_delay = min(poll_delay * 1.5, 10)
         fn.update()
 
     # Attempt to cancel deployment because of timeout:
@@ -73,10 +79,11 @@ def create_function(client: CogniteClient, file_id: int, fn_config: FunctionConf
             raise
 
 
-def delete_function(client: CogniteClient, xid: str):
+def delete_function(client: CogniteClient, xid: str) -> bool:
     if (fn := client.functions.retrieve(external_id=xid)) is not None:
         logger.info(f"Deleting existing function '{xid}' (ID: {fn.id})")
         client.functions.delete(external_id=xid)
         logger.info(f"- Delete of function '{xid}' successful!")
-    else:
-        logger.info(f"Unable to delete function! External ID: '{xid}' NOT found!")
+        return True
+    logger.info(f"Unable to delete function! External ID: '{xid}' NOT found!")
+    return False
@@ -17,10 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 def _write_files_to_zip_buffer(zf: ZipFile, directory: Path):
+    # Note: os.walk is scandir-based already, just avoid creating a Path per file:
     for dirpath, _, files in os.walk(directory):
         zf.write(dirpath)
         for f in files:
-            zf.write(Path(dirpath) / f)
+            zf.write(os.path.join(dirpath, f))
 
 
 def _await_file_upload_status(client: CogniteClient, file_id: int, xid: str):
@@ -58,8 +59,8 @@ def upload_zipped_code_to_files(
     return file_meta
 
 
-def zip_and_upload_folder(client: CogniteClient, fn_config: FunctionConfig, xid: str) -> int:
-    logger.info(f"Uploading code from '{fn_config.function_folder}' to Files using external ID: '{xid}'")
+def zip_function_code(fn_config: FunctionConfig) -> bytes:
+    logger.info(f"Zipping code from '{fn_config.function_folder}'")
     buf = io.BytesIO()  # TempDir, who needs that?! :rocket:
     with ZipFile(buf, mode="a") as zf:
         with temporary_chdir(fn_config.function_folder):
@@ -69,7 +70,11 @@ def zip_and_upload_folder(client: CogniteClient, fn_config: FunctionConfig, xid:
             with temporary_chdir(common_folder.parent):  # Note .parent
                 logger.info(f"- Added common directory: '{common_folder}' to the file/function")
                 _write_files_to_zip_buffer(zf, directory=common_folder)
+    return buf.getvalue()
+
 
+def upload_function_code(client: CogniteClient, fn_config: FunctionConfig, file_bytes: bytes, xid: str) -> int:
+    logger.info(f"Uploading code from '{fn_config.function_folder}' to Files using external ID: '{xid}'")
     if (ds_id := fn_config.data_set_id) is not None:
         ds = retrieve_dataset(client, ds_id)
         logger.info(
@@ -80,23 +85,25 @@ def zip_and_upload_folder(client: CogniteClient, fn_config: FunctionConfig, xid:
         ds = DataSet(id=None)
         logger.info("- No dataset will be used to govern the function zip-file!")
 
-    file_meta = upload_zipped_code_to_files(client, buf.getvalue(), xid, ds)
+    file_meta = upload_zipped_code_to_files(client, file_bytes, xid, ds)
     logger.info(f"- File uploaded successfully ({xid})!")
     return file_meta.id
 
 
-def delete_function_file(client: CogniteClient, xid: str):
+def delete_function_file(client: CogniteClient, xid: str) -> bool:
     if (file_meta := client.files.retrieve(external_id=xid)) is None:
         logger.info(f"Unable to delete file! External ID: '{xid}' NOT found!")
-        return
+        return False
 
     logger.info(f"Deleting existing file '{xid}' (ID: {file_meta.id})")
     try:
         client.files.delete(external_id=xid)
         logger.info(f"- Delete of file '{xid}' successful!")
+        return True
     except CogniteAPIError as e:
         reason = f"{type(e).__name__}({e})"  # 'CogniteAPIError' does not implement dunder repr...
         logger.error(
             "Unable to delete file! Trying to ignore and continue as this action will overwrite "
             f"the file later. Error message from the API: \n{reason}"
         )
+        return False
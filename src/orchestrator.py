@@ -1,5 +1,6 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from cognite.client import CogniteClient
 from cognite.client.data_classes import Function
@@ -7,25 +8,36 @@ from cognite.client.data_classes import Function
 from configs import FunctionConfig
 from exceptions import FunctionDeployError
 from function import await_function_deployment, create_function, delete_function
-from function_file import delete_function_file, zip_and_upload_folder
+from function_file import delete_function_file, upload_function_code, zip_function_code
 from utils import create_zipfile_name, retry
 
 logger = logging.getLogger(__name__)
 
 
 def remove_function_with_file(client: CogniteClient, fn_xid: str):
-    delete_function(client, fn_xid)
-    delete_function_file(client, create_zipfile_name(fn_xid))
-    time.sleep(3)  # Tiny breather
+    # Function and code file are independent, delete them concurrently:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(delete_function, client, fn_xid),
+            executor.submit(delete_function_file, client, create_zipfile_name(fn_xid)),
+        ]
+        # Note: Get all results (not 'any(generator)') so that no exception is silently dropped:
+        if any([fut.result() for fut in futures]):
+            time.sleep(3)  # Tiny breather, only needed when something was actually deleted
 
 
-@retry(exceptions=FunctionDeployError, tries=2, delay=5, backoff=2, logger=logger)
 def upload_and_create_function(client: CogniteClient, fn_config: FunctionConfig) -> Function:
+    # Zip the code just once, the same bytes are reused if the deployment is retried:
+    return _upload_and_create_function(client, fn_config, zip_function_code(fn_config))
+
+
+@retry(exceptions=FunctionDeployError, tries=2, delay=5, backoff=2, logger=logger)
+def _upload_and_create_function(client: CogniteClient, fn_config: FunctionConfig, file_bytes: bytes) -> Function:
     fn_xid = fn_config.function_external_id
     remove_function_with_file(client, fn_xid)
     file_xid = create_zipfile_name(fn_xid)
 
-    file_id = zip_and_upload_folder(client, fn_config, file_xid)
+    file_id = upload_function_code(client, fn_config, file_bytes, file_xid)
     fn_under_deployment = create_function(client, file_id, fn_config)
     if fn_config.await_deployment_success:
         return await_function_deployment(fn_under_deployment, fn_config.function_deploy_timeout)
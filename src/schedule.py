@@ -13,11 +13,11 @@ def deploy_schedules(fn: Function, schedule_config: SchedulesConfig):
         return
 
     logger.info(f"Attaching {len(schedules)} schedule(s) to {fn.external_id} (by ID: {fn.id})")
-    client = schedule_config.client
+    client, credentials = schedule_config.client, schedule_config.credentials
     for s in schedules:
         client.functions.schedules.create(
             function_id=fn.id,
-            client_credentials=schedule_config.credentials,
+            client_credentials=credentials,
             **dict(s),
         )
         logger.info(f"- Schedule '{s.name}' with cron: '{s.cron_expression}' attached successfully!")
@@ -12,6 +12,7 @@ from cognite.client import ClientConfig, CogniteClient
 from cognite.client.config import global_config
 from cognite.client.credentials import OAuthClientCredentials
 from cognite.client.data_classes import DataSet
+from cognite.client.data_classes.functions import FunctionsLimits
 from cognite.client.data_classes.iam import GroupList, TokenInspection
 from decorator import decorator  # type: ignore [import]
 from pydantic import constr
@@ -43,7 +44,7 @@ def create_zipfile_name(function_name: str) -> str:
 def decode_and_parse(value: Optional[str]) -> Optional[Dict]:
     if value is None:
         return None
-    return json.loads(base64.b64decode(value.encode()))
+    return json.loads(base64.b64decode(value))
 
 
 def verify_path_is_directory(path: Path, parameter: str) -> Path:
@@ -69,6 +70,11 @@ def retrieve_dataset(client: CogniteClient, id: int) -> DataSet:
     raise ValueError(f"No dataset exists with ID: '{id}'")
 
 
+@lru_cache(None)
+def retrieve_function_limits(client: CogniteClient) -> FunctionsLimits:
+    return client.functions.limits()
+
+
 @lru_cache(None)
 def create_oidc_client(
     tenant_id: str, client_id: str, client_secret: str, cdf_cluster: str, cdf_project: str
@@ -89,8 +95,11 @@ def create_oidc_client(
     )
 
 
+_OIDC_CLIENT_PARAMS = tuple(signature(create_oidc_client).parameters)
+
+
 def create_oidc_client_from_dct(dct):
-    return create_oidc_client(**{k: dct[k] for k in signature(create_oidc_client).parameters})
+    return create_oidc_client(**{k: dct[k] for k in _OIDC_CLIENT_PARAMS})
 
 
 def _retry(fn, exceptions=Exception, tries=-1, delay=0, max_delay=None, backoff=1, jitter=0, logger=None):
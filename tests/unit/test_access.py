@@ -0,0 +1,138 @@
+import pytest
+from cognite.client.data_classes import DataSet
+
+import access
+from access import Capability, CapabilityIndex, missing_files_capabilities
+
+DS_ID = 123
+
+
+def make_index(*capabilities):
+    return CapabilityIndex(map(Capability.from_dct, capabilities))
+
+
+def files_acl(actions, scope):
+    return {"filesAcl": {"actions": actions, "scope": scope}}
+
+
+def datasets_acl(actions, scope):
+    return {"datasetsAcl": {"actions": actions, "scope": scope}}
+
+
+def fail_on_retrieve_dataset(client, ds_id):
+    pytest.fail("Data set should not be looked up")
+
+
+class TestCapabilityIndex:
+    def test_all_scope_and_dataset_scope_actions(self):
+        capabs = make_index(
+            files_acl(["READ"], {"all": {}}),
+            files_acl(["WRITE"], {"datasetScope": {"ids": [DS_ID]}}),
+            {"functionsAcl": {"actions": ["READ", "WRITE"], "scope": {"all": {}}}},
+        )
+        assert capabs.actions("filesAcl") == {"READ", "WRITE"}
+        assert capabs.all_scope_actions("filesAcl") == {"READ"}
+        assert capabs.actions("functionsAcl") == capabs.all_scope_actions("functionsAcl") == {"READ", "WRITE"}
+        assert [c.is_dataset_scope(DS_ID) for c in capabs.get("filesAcl")] == [False, True]
+
+    def test_missing_acl(self):
+        capabs = make_index(files_acl(["READ"], {"all": {}}))
+        assert capabs.get("sessionsAcl") == ()
+        assert capabs.actions("sessionsAcl") == frozenset()
+        assert capabs.all_scope_actions("sessionsAcl") == frozenset()
+
+    def test_string_ids_in_scope(self):
+        (files_capab,) = make_index(files_acl(["READ"], {"datasetScope": {"ids": [str(DS_ID)]}})).get("filesAcl")
+        (ds_capab,) = make_index(datasets_acl(["READ"], {"idScope": {"ids": [str(DS_ID)]}})).get("datasetsAcl")
+        assert files_capab.is_dataset_scope(DS_ID)
+        assert not files_capab.is_all_scope()
+        assert ds_capab.is_ids_scope(DS_ID)
+        assert not ds_capab.is_ids_scope(DS_ID + 1)
+
+
+class TestMissingFilesCapabilities:
+    def test_no_data_set(self, monkeypatch):
+        monkeypatch.setattr(access, "retrieve_dataset", fail_on_retrieve_dataset)
+        capabs = make_index(files_acl(["READ"], {"all": {}}))
+
+        missing = missing_files_capabilities(capabs, client=None)
+        assert missing == ["FilesAcl:WRITE (scope: 'all') (Tip: consider using a data set!)"]
+
+    def test_with_owner(self, monkeypatch):
+        retrieved = []
+
+        def retrieve_dataset(client, ds_id):
+            retrieved.append(ds_id)
+            return DataSet(id=ds_id, write_protected=True)
+
+        monkeypatch.setattr(access, "retrieve_dataset", retrieve_dataset)
+        capabs = make_index(
+            files_acl(["READ", "WRITE"], {"datasetScope": {"ids": [DS_ID]}}),
+            datasets_acl(["READ", "OWNER"], {"idScope": {"ids": [DS_ID]}}),
+        )
+        assert missing_files_capabilities(capabs, client=None, ds_id=DS_ID) == []
+        assert retrieved == [DS_ID]
+
+    def test_with_owner_missing_data_set(self, monkeypatch):
+        def retrieve_dataset(client, ds_id):
+            raise ValueError(f"No dataset exists with ID: '{ds_id}'")
+
+        monkeypatch.setattr(access, "retrieve_dataset", retrieve_dataset)
+        capabs = make_index(
+            files_acl(["READ", "WRITE"], {"all": {}}),
+            datasets_acl(["READ", "OWNER"], {"all": {}}),
+        )
+        with pytest.raises(ValueError, match="No dataset exists"):
+            missing_files_capabilities(capabs, client=None, ds_id=DS_ID)
+
+    @pytest.mark.parametrize("write_protected", (True, False))
+    def test_without_owner(self, monkeypatch, write_protected):
+        retrieved = []
+
+        def retrieve_dataset(client, ds_id):
+            retrieved.append(ds_id)
+            return DataSet(id=ds_id, write_protected=write_protected)
+
+        monkeypatch.setattr(access, "retrieve_dataset", retrieve_dataset)
+        capabs = make_index(
+            files_acl(["READ", "WRITE"], {"all": {}}),
+            datasets_acl(["READ"], {"all": {}}),
+        )
+        missing = missing_files_capabilities(capabs, client=None, ds_id=DS_ID)
+        assert retrieved == [DS_ID]
+        if write_protected:
+            assert len(missing) == 1
+            assert missing[0].startswith(f"DatasetsAcl:OWNER (scope: 'all' OR 'id: {DS_ID}')")
+        else:
+            assert missing == []
+
+    def test_without_data_sets_read(self, monkeypatch):
+        monkeypatch.setattr(access, "retrieve_dataset", fail_on_retrieve_dataset)
+        capabs = make_index(
+            files_acl(["READ"], {"datasetScope": {"ids": [DS_ID]}}),
+            datasets_acl(["READ"], {"idScope": {"ids": [DS_ID + 1]}}),
+        )
+        missing = missing_files_capabilities(capabs, client=None, ds_id=DS_ID)
+        assert missing == [
+            f"FilesAcl:WRITE (scope: 'all' OR 'dataset: {DS_ID}')",
+            f"DatasetsAcl:READ (scope: 'all' OR 'id: {DS_ID}')",
+            "(If dataset is write protected, you'll also need OWNER)",
+        ]
+
+
+class TestVerifyDeployCapabilities:
+    def test_missing_data_set_fails(self, monkeypatch):
+        def retrieve_dataset(client, ds_id):
+            raise ValueError(f"No dataset exists with ID: '{ds_id}'")
+
+        capabs = make_index(
+            {"functionsAcl": {"actions": ["READ", "WRITE"], "scope": {"all": {}}}},
+            files_acl(["READ", "WRITE"], {"all": {}}),
+            datasets_acl(["READ", "OWNER"], {"all": {}}),
+        )
+        monkeypatch.setattr(access, "retrieve_dataset", retrieve_dataset)
+        monkeypatch.setattr(access, "check_basics_and_retrieve_capabilities", lambda *args: capabs)
+
+        # The error from the prefetch is ignored, but must be raised again by the actual (uncached) lookup:
+        with pytest.raises(ValueError, match="No dataset exists"):
+            access.verify_deploy_capabilites(None, "test-project", ds_id=999)
@@ -0,0 +1,44 @@
+import pytest
+
+
+class TestCheckHandleArgs:
+    @pytest.mark.parametrize(
+        "source",
+        (
+            "def handle(data, client):\n    pass\n",
+            "def handle(client, data, secrets, function_call_info):\n    pass\n",
+            "def handle(\n    data: dict,\n    client=None,\n) -> dict:\n    pass\n",
+            "class Foo:\n    def handle(self, bar):\n        pass\n\n\ndef handle(data):\n    pass\n",
+        ),
+    )
+    def test_valid_handle(self, gh_actions_env, tmp_path, source):
+        from checks import _check_handle_args
+
+        (file_path := tmp_path / "handler.py").write_text(source)
+        _check_handle_args(file_path)
+
+    @pytest.mark.parametrize(
+        "source",
+        (
+            "def handle(data, foo):\n    pass\n",
+            "def handle(data):\n    pass\n\n\ndef handle(client):\n    pass\n",
+            "def main(data):\n    pass\n",
+            "if True:\n\n    def handle(data):\n        pass\n",
+            '"""\ndef handle(data):\n"""\n\n\nclass Foo:\n    def handle(self, data):\n        pass\n',
+        ),
+    )
+    def test_invalid_handle(self, gh_actions_env, tmp_path, source):
+        from checks import _check_handle_args
+        from exceptions import FunctionValidationError
+
+        (file_path := tmp_path / "handler.py").write_text(source)
+        with pytest.raises(FunctionValidationError):
+            _check_handle_args(file_path)
+
+    def test_unparsable_file_is_not_rejected(self, gh_actions_env, tmp_path, caplog):
+        from checks import _check_handle_args
+
+        # The file might use syntax from a newer Python runtime than the one running this action:
+        (file_path := tmp_path / "handler.py").write_text("def handle(data, client):\n    return data +\n")
+        _check_handle_args(file_path)
+        assert "Unable to parse file" in caplog.text
@@ -137,3 +137,18 @@ class TestFunctionConfig:
 
         with pytest.raises(ValidationError):
             FunctionConfig.from_envvars()
+
+
+class TestFunctionSchedule:
+    @pytest.mark.parametrize("cron", ["0 * * * *", "*/15 0-6 * * 1-5"])
+    def test_valid_cron(self, gh_actions_env, cron):
+        from configs import FunctionSchedule
+
+        assert FunctionSchedule(name="test-schedule", cron=cron).cron_expression == cron
+
+    @pytest.mark.parametrize("cron", ["0 * * *", "61 * * * *", "every minute"])
+    def test_invalid_cron(self, gh_actions_env, cron):
+        from configs import FunctionSchedule
+
+        with pytest.raises(ValidationError):
+            FunctionSchedule(name="test-schedule", cron=cron)
@@ -1,6 +1,9 @@
+import base64
+import json
+
 import pytest
 
-from utils import FnFileString
+from utils import FnFileString, decode_and_parse
 
 
 @pytest.mark.parametrize(
@@ -17,3 +20,9 @@ from utils import FnFileString
 )
 def test_function_file_regex(path, is_correct):
     assert bool(FnFileString.regex.match(path)) == is_correct
+
+
+@pytest.mark.parametrize("secrets", ({"foo": "bar"}, {"foo": "bar", "baz": "æøå"}, {}))
+def test_decode_and_parse(secrets):
+    encoded = base64.b64encode(json.dumps(secrets).encode()).decode()
+    assert decode_and_parse(encoded) == secrets